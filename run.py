@@ -9,22 +9,26 @@ Run with: python run.py
 """
 import sys
 import os
+from typing import TYPE_CHECKING
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from vending_machine.models import Soda, Juice, Water, Inventory
-from vending_machine.core import VendingMachine
-from vending_machine.ui import MenuHandler
+# The package is imported inside the functions below so that importing
+# this module stays cheap; only starting the simulator pays for it.
+if TYPE_CHECKING:
+    from vending_machine.models import Inventory
 
 
-def create_default_inventory() -> Inventory:
+def create_default_inventory() -> "Inventory":
     """
     Create the default inventory with sample drinks.
     
     Returns:
         Inventory: Stocked inventory ready for use
     """
+    from vending_machine.models import Soda, Juice, Water, Inventory
+    
     inventory = Inventory()
     
     # Add Sodas
@@ -47,6 +51,9 @@ def create_default_inventory() -> Inventory:
 
 def main():
     """Main entry point for the vending machine simulator."""
+    from vending_machine.core import VendingMachine
+    from vending_machine.ui import MenuHandler
+    
     try:
         # Initialize components
         inventory = create_default_inventory()
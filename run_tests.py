@@ -22,6 +22,7 @@ def run_tests():
     
     # Discover tests
     loader = unittest.TestLoader()
+    loader.sortTestMethodsUsing = None  # Tests do not depend on method order
     suite = loader.discover('tests', pattern='test_*.py')
     
     # Run with verbosity
@@ -1,4 +1,18 @@
 # Core package
-from .machine import VendingMachine
+from .machine import (
+    VendingMachine,
+    PurchaseResult,
+    INVALID_PRODUCT_PREFIX,
+    OUT_OF_STOCK_SUFFIX,
+    INSUFFICIENT_FUNDS_PREFIX,
+    PAYMENT_FAILED_MSG
+)
 
-__all__ = ['VendingMachine']
+__all__ = [
+    'VendingMachine',
+    'PurchaseResult',
+    'INVALID_PRODUCT_PREFIX',
+    'OUT_OF_STOCK_SUFFIX',
+    'INSUFFICIENT_FUNDS_PREFIX',
+    'PAYMENT_FAILED_MSG'
+]
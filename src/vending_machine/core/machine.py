@@ -2,7 +2,8 @@
 Core VendingMachine controller.
 Orchestrates interactions between inventory, payment, and transactions.
 """
-from typing import Tuple, Optional, Dict
+import math
+from typing import NamedTuple, Optional, Dict
 
 from ..models import Inventory, Drink
 from ..services import CashPaymentService, TransactionService, PaymentService
@@ -13,6 +14,23 @@ from ..utils import (
     InvalidAmountError
 )
 
+# Fixed parts of the purchase result messages
+INVALID_PRODUCT_PREFIX = "Invalid product code: "
+OUT_OF_STOCK_SUFFIX = " is out of stock"
+INSUFFICIENT_FUNDS_PREFIX = "Insufficient funds. "
+PAYMENT_FAILED_MSG = "Payment processing failed"
+
+
+class PurchaseResult(NamedTuple):
+    """
+    Outcome of a purchase attempt.
+    
+    Unpacks like the plain (success, message, transaction) tuple.
+    """
+    success: bool
+    message: str
+    transaction: Optional[Dict]
+
 
 class VendingMachine:
     """
@@ -40,9 +58,19 @@ class VendingMachine:
             transaction_service: Optional custom transaction service
         """
         self._inventory = inventory
-        self._payment = payment_service or CashPaymentService()
-        self._transactions = transaction_service or TransactionService()
-        self._cash_reserve = 0.0  # Track accumulated revenue from sales
+        self._payment = (
+            payment_service if payment_service is not None else CashPaymentService()
+        )
+        self._transactions = (
+            transaction_service if transaction_service is not None
+            else TransactionService()
+        )
+        self._cash_reserve_cents = 0  # Track accumulated revenue from sales
+        # The stock cash service is driven directly on hot paths
+        self._is_cash_payment = type(self._payment) is CashPaymentService
+        self._purchase = (
+            self._purchase_fast if self._is_cash_payment else self._purchase_general
+        )
     
     @property
     def balance(self) -> float:
@@ -62,7 +90,7 @@ class VendingMachine:
     @property
     def cash_reserve(self) -> float:
         """Get the current cash reserve in the machine."""
-        return self._cash_reserve
+        return self._cash_reserve_cents / 100
     
     def insert_money(self, amount: float) -> float:
         """
@@ -75,14 +103,20 @@ class VendingMachine:
             The new balance
             
         Raises:
-            InvalidAmountError: If amount is not positive
+            InvalidAmountError: If amount is not finite or not at least one cent
         """
-        if amount <= 0:
+        cents = round(amount * 100) if math.isfinite(amount) else 0
+        if cents <= 0:
             raise InvalidAmountError(amount)
+        if self._is_cash_payment:
+            # Amount already validated above; skip the service's own check
+            payment = self._payment
+            payment._balance_cents += cents
+            return payment._balance_cents / 100
         self._payment.insert_money(amount)
         return self.balance
     
-    def select_item(self, code: str) -> Tuple[bool, str, Optional[Dict]]:
+    def select_item(self, code: str) -> PurchaseResult:
         """
         Attempt to purchase an item.
         
@@ -90,50 +124,112 @@ class VendingMachine:
             code: The product code
             
         Returns:
-            Tuple of (success, message, transaction_dict)
+            PurchaseResult of (success, message, transaction_dict)
         """
+        return self._purchase(code)
+    
+    def _purchase_fast(self, code: str) -> PurchaseResult:
+        """
+        Purchase path specialised for the stock CashPaymentService.
+        
+        Handles the common successful purchase by reading inventory and
+        cash balance state directly; every failure case falls back to
+        the general path, which produces the messages and failed records.
+        """
+        inventory = self._inventory
+        drink = inventory._drinks.get(code)
+        if drink is not None:
+            payment = self._payment
+            price_cents = drink.price_cents
+            balance_cents = payment._balance_cents
+            if balance_cents >= price_cents and inventory._quantities[code] > 0:
+                inventory.decrement_stock(code)
+                payment._balance_cents = 0
+                change_cents = balance_cents - price_cents
+                self._cash_reserve_cents += price_cents
+                txn = self._transactions.create_success(
+                    code, drink.name, price_cents / 100,
+                    balance_cents / 100, change_cents / 100
+                )
+                return PurchaseResult(
+                    True,
+                    f"Dispensing {drink.name}. Your change is ${change_cents / 100:.2f}",
+                    txn.to_dict()
+                )
+        return self._purchase_general(code)
+    
+    def _purchase_general(self, code: str) -> PurchaseResult:
+        """Purchase path that works with any PaymentService."""
+        drink, quantity = self._inventory.get_item_and_quantity(code)
+        
         # Validate product exists
-        drink = self._inventory.get_item(code)
-        if not drink:
-            return False, f"Invalid product code: {code}", None
+        if drink is None:
+            return PurchaseResult(False, INVALID_PRODUCT_PREFIX + code, None)
+        
+        balance_cents = self._payment.get_balance_cents()
         
         # Check stock
-        if not self._inventory.has_stock(code):
+        if quantity <= 0:
             self._transactions.create_failed(
                 code, drink.name, drink.price,
-                self.balance, "Out of stock"
+                balance_cents / 100, "Out of stock"
             )
-            return False, f"{drink.name} is out of stock", None
+            return PurchaseResult(False, drink.name + OUT_OF_STOCK_SUFFIX, None)
         
         # Check funds
-        if self.balance < drink.price:
+        price_cents = drink.price_cents
+        if balance_cents < price_cents:
             self._transactions.create_failed(
                 code, drink.name, drink.price,
-                self.balance, "Insufficient funds"
+                balance_cents / 100, "Insufficient funds"
             )
-            return (
+            return PurchaseResult(
                 False,
-                f"Insufficient funds. {drink.name} costs ${drink.price:.2f}, "
-                f"but you only have ${self.balance:.2f}",
+                f"{INSUFFICIENT_FUNDS_PREFIX}{drink.name} costs ${price_cents / 100:.2f}, "
+                f"but you only have ${balance_cents / 100:.2f}",
                 None
             )
         
         # Process purchase
-        success, change = self._payment.deduct(drink.price)
+        success, change_cents = self._payment.deduct_cents(price_cents)
         if success:
             self._inventory.decrement_stock(code)
-            self._cash_reserve += drink.price  # Add revenue to cash reserve
+            self._cash_reserve_cents += price_cents  # Add revenue to cash reserve
             txn = self._transactions.create_success(
                 code, drink.name, drink.price,
-                drink.price + change, change
+                (price_cents + change_cents) / 100, change_cents / 100
             )
-            return (
+            return PurchaseResult(
                 True,
-                f"Dispensing {drink.name}. Your change is ${change:.2f}",
+                f"Dispensing {drink.name}. Your change is ${change_cents / 100:.2f}",
                 txn.to_dict()
             )
         
-        return False, "Payment processing failed", None
+        return PurchaseResult(False, PAYMENT_FAILED_MSG, None)
+    
+    def _bulk_purchase(self, code: str, count: int) -> bool:
+        """
+        Sell several units of an item in one call, bypassing payment.
+        
+        Test hook for draining stock: the units are paid at exactly the
+        item price, added to the cash reserve and recorded as successful
+        transactions.
+        
+        Args:
+            code: The product code
+            count: Number of units to sell
+            
+        Returns:
+            True if successful, False if not found or not enough stock
+        """
+        drink = self._inventory.get_item(code)
+        if drink is None or not self._inventory.decrement_stock(code, count):
+            return False
+        self._cash_reserve_cents += drink.price_cents * count
+        price = drink.price
+        for _ in range(count):
+            self._transactions.create_success(code, drink.name, price, price, 0.0)
+        return True
     
     def refund(self) -> float:
         """
@@ -162,6 +258,6 @@ class VendingMachine:
         Returns:
             The amount of cash withdrawn from the machine
         """
-        amount = self._cash_reserve
-        self._cash_reserve = 0.0
+        amount = self._cash_reserve_cents / 100
+        self._cash_reserve_cents = 0
         return amount
@@ -2,17 +2,26 @@
 Drink models implementing an inheritance hierarchy.
 Demonstrates polymorphism and the Open/Closed Principle.
 """
-from abc import ABC, abstractmethod
+import math
 
+# Category names shared by every instance of each drink type
+_SODA = "Soda"
+_JUICE = "Juice"
+_WATER = "Water"
 
-class Drink(ABC):
+
+class Drink:
     """
     Abstract base class for all drinks.
     
     Provides a template for drink products with common attributes
     and enforces implementation of specific methods in subclasses.
+    It is a plain class rather than an ABC to keep metaclass machinery
+    off the hot attribute paths; direct instantiation is still refused.
     """
     
+    __slots__ = ('code', 'name', 'price_cents', '_description')
+    
     def __init__(self, code: str, name: str, price: float):
         """
         Initialize a Drink.
@@ -21,43 +30,39 @@ class Drink(ABC):
             code: Unique product code (e.g., "A1")
             name: Display name of the drink
             price: Price in dollars
+            
+        Raises:
+            TypeError: If Drink itself is instantiated
+            ValueError: If price is not finite or is negative
         """
+        if type(self) is Drink:
+            raise TypeError("Drink is abstract and cannot be instantiated directly")
+        if not math.isfinite(price):
+            raise ValueError("Price must be a finite number")
         if price < 0:
             raise ValueError("Price cannot be negative")
-        self._code = code
-        self._name = name
-        self._price = price
-    
-    @property
-    def code(self) -> str:
-        """Get the drink's product code."""
-        return self._code
-    
-    @property
-    def name(self) -> str:
-        """Get the drink's name."""
-        return self._name
+        self.code = code
+        self.name = name
+        self.price_cents = round(price * 100)
     
     @property
     def price(self) -> float:
-        """Get the drink's price."""
-        return self._price
+        """Get the drink's price in dollars."""
+        return self.price_cents / 100
     
-    @abstractmethod
     def get_description(self) -> str:
         """
         Get a description of the drink.
         Must be implemented by subclasses.
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def get_category(self) -> str:
         """
         Get the drink category.
         Must be implemented by subclasses.
         """
-        pass
+        raise NotImplementedError
     
     def __str__(self) -> str:
         return f"{self.name} (${self.price:.2f})"
@@ -69,54 +74,63 @@ class Drink(ABC):
 class Soda(Drink):
     """Carbonated soft drink."""
     
+    __slots__ = ('_is_diet',)
+    
     def __init__(self, code: str, name: str, price: float, is_diet: bool = False):
         super().__init__(code, name, price)
         self._is_diet = is_diet
+        diet_str = "Diet " if is_diet else ""
+        self._description = f"{diet_str}Carbonated soft drink"
     
     @property
     def is_diet(self) -> bool:
         return self._is_diet
     
     def get_description(self) -> str:
-        diet_str = "Diet " if self._is_diet else ""
-        return f"{diet_str}Carbonated soft drink"
+        return self._description
     
     def get_category(self) -> str:
-        return "Soda"
+        return _SODA
 
 
 class Juice(Drink):
     """Fruit juice drink."""
     
+    __slots__ = ('_fruit_type',)
+    
     def __init__(self, code: str, name: str, price: float, fruit_type: str = "Mixed"):
         super().__init__(code, name, price)
         self._fruit_type = fruit_type
+        self._description = f"Fresh {fruit_type} juice"
     
     @property
     def fruit_type(self) -> str:
         return self._fruit_type
     
     def get_description(self) -> str:
-        return f"Fresh {self._fruit_type} juice"
+        return self._description
     
     def get_category(self) -> str:
-        return "Juice"
+        return _JUICE
 
 
 class Water(Drink):
     """Bottled water."""
     
+    __slots__ = ('_is_sparkling',)
+    
     def __init__(self, code: str, name: str, price: float, is_sparkling: bool = False):
         super().__init__(code, name, price)
         self._is_sparkling = is_sparkling
+        water_type = "Sparkling" if is_sparkling else "Still"
+        self._description = f"{water_type} mineral water"
     
     @property
     def is_sparkling(self) -> bool:
         return self._is_sparkling
     
     def get_description(self) -> str:
-        water_type = "Sparkling" if self._is_sparkling else "Still"
-        return f"{water_type} mineral water"
+        return self._description
     
     def get_category(self) -> str:
-        return "Water"
+        return _WATER
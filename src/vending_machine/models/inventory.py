@@ -2,7 +2,7 @@
 Inventory management for the vending machine.
 Handles stock levels and product availability.
 """
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from .drinks import Drink
 
 
@@ -17,7 +17,17 @@ class Inventory:
     
     def __init__(self):
         """Initialize an empty inventory."""
-        self._stock: Dict[str, dict] = {}  # code -> {'drink': Drink, 'quantity': int}
+        self._drinks: Dict[str, Drink] = {}  # code -> Drink
+        self._quantities: Dict[str, int] = {}  # code -> quantity
+        self._available: Dict[str, Drink] = {}  # code -> Drink, only while quantity > 0
+        # code -> {'name', 'price', 'category', 'description'}, built lazily
+        self._static_cache: Dict[str, dict] = {}
+        self._version = 0  # Bumped whenever products or quantities change
+    
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever products or quantities change."""
+        return self._version
     
     def add_item(self, drink: Drink, quantity: int) -> None:
         """
@@ -33,10 +43,14 @@ class Inventory:
         if quantity < 0:
             raise ValueError("Quantity cannot be negative")
         
-        self._stock[drink.code] = {
-            'drink': drink,
-            'quantity': quantity
-        }
+        self._drinks[drink.code] = drink
+        self._quantities[drink.code] = quantity
+        self._static_cache.pop(drink.code, None)
+        self._version += 1
+        if quantity > 0:
+            self._available[drink.code] = drink
+        else:
+            self._available.pop(drink.code, None)
     
     def get_item(self, code: str) -> Optional[Drink]:
         """
@@ -48,8 +62,19 @@ class Inventory:
         Returns:
             The Drink object if found, None otherwise
         """
-        item = self._stock.get(code)
-        return item['drink'] if item else None
+        return self._drinks.get(code)
+    
+    def get_item_and_quantity(self, code: str) -> Tuple[Optional[Drink], int]:
+        """
+        Get a drink and its stock quantity in a single lookup.
+        
+        Args:
+            code: The product code
+            
+        Returns:
+            Tuple of (Drink or None, quantity in stock)
+        """
+        return self._drinks.get(code), self._quantities.get(code, 0)
     
     def has_stock(self, code: str) -> bool:
         """
@@ -61,8 +86,7 @@ class Inventory:
         Returns:
             True if the item exists and has quantity > 0
         """
-        item = self._stock.get(code)
-        return item is not None and item['quantity'] > 0
+        return self._quantities.get(code, 0) > 0
     
     def get_quantity(self, code: str) -> int:
         """
@@ -74,22 +98,28 @@ class Inventory:
         Returns:
             The quantity in stock, or 0 if not found
         """
-        item = self._stock.get(code)
-        return item['quantity'] if item else 0
+        return self._quantities.get(code, 0)
     
-    def decrement_stock(self, code: str) -> bool:
+    def decrement_stock(self, code: str, count: int = 1) -> bool:
         """
-        Decrease stock by 1 after a purchase.
+        Decrease stock after a purchase.
         
         Args:
             code: The product code
+            count: Number of units to remove (defaults to 1)
             
         Returns:
-            True if successful, False if out of stock or not found
+            True if successful, False if not found, not enough stock
+            or count is not positive
         """
-        if not self.has_stock(code):
+        quantity = self._quantities.get(code, 0)
+        if count < 1 or quantity < count:
             return False
-        self._stock[code]['quantity'] -= 1
+        remaining = quantity - count
+        self._quantities[code] = remaining
+        self._version += 1
+        if not remaining:
+            del self._available[code]
         return True
     
     def restock(self, code: str, quantity: int) -> bool:
@@ -103,44 +133,88 @@ class Inventory:
         Returns:
             True if successful, False if item not found
         """
-        if code not in self._stock:
-            return False
+        return self.restock_and_get(code, quantity)[0]
+    
+    def restock_and_get(self, code: str, quantity: int) -> Tuple[bool, int]:
+        """
+        Add stock to an existing item and report the new quantity.
+        
+        Args:
+            code: The product code
+            quantity: Amount to add
+            
+        Returns:
+            Tuple of (success, new_quantity); (False, 0) if item not found
+            
+        Raises:
+            ValueError: If quantity is negative
+        """
+        current = self._quantities.get(code)
+        if current is None:
+            return False, 0
         if quantity < 0:
             raise ValueError("Restock quantity cannot be negative")
-        self._stock[code]['quantity'] += quantity
-        return True
+        new_quantity = current + quantity
+        self._quantities[code] = new_quantity
+        self._version += 1
+        if quantity > 0:
+            self._available[code] = self._drinks[code]
+        return True, new_quantity
     
     def get_all_items(self) -> Dict[str, dict]:
         """
         Get all items with their details.
         
+        Per-product details that never change after ``add_item`` are
+        cached; only the live quantity is merged in on each call.
+        
         Returns:
             Dictionary of all stock items
         """
-        return {
-            code: {
-                'name': data['drink'].name,
-                'price': data['drink'].price,
-                'quantity': data['quantity'],
-                'category': data['drink'].get_category(),
-                'description': data['drink'].get_description()
-            }
-            for code, data in self._stock.items()
-        }
+        quantities = self._quantities
+        static_cache = self._static_cache
+        items = {}
+        for code, drink in self._drinks.items():
+            static = static_cache.get(code)
+            if static is None:
+                static = static_cache[code] = {
+                    'name': drink.name,
+                    'price': drink.price,
+                    'category': drink.get_category(),
+                    'description': drink.get_description()
+                }
+            items[code] = dict(static, quantity=quantities[code])
+        return items
     
     def get_available_items(self) -> List[Drink]:
         """
         Get all drinks that are currently in stock.
         
+        Drinks are listed in the order they last came into stock, so a
+        product that sold out and was restocked moves to the end; use
+        ``get_all_items`` for catalogue order.
+        
         Returns:
             List of available Drink objects
         """
-        return [
-            data['drink']
-            for data in self._stock.values()
-            if data['quantity'] > 0
-        ]
+        return list(self._available.values())
+    
+    def __copy__(self) -> "Inventory":
+        """
+        Copy the inventory with independent stock levels.
+        
+        The bookkeeping dicts are copied so stock changes on either
+        inventory don't affect the other; the Drink objects are shared.
+        """
+        cls = type(self)
+        clone = cls.__new__(cls)
+        clone.__dict__.update(self.__dict__)
+        clone._drinks = dict(self._drinks)
+        clone._quantities = dict(self._quantities)
+        clone._available = dict(self._available)
+        clone._static_cache = dict(self._static_cache)
+        return clone
     
     def __len__(self) -> int:
         """Return the total number of unique products."""
-        return len(self._stock)
+        return len(self._drinks)
@@ -2,37 +2,43 @@
 Payment service abstraction.
 Implements the Dependency Inversion Principle for payment processing.
 """
-from abc import ABC, abstractmethod
+import math
 from typing import Tuple
 
 
-class PaymentService(ABC):
+class PaymentService:
     """
     Abstract base class for payment processing.
     
     Allows the vending machine to work with different payment methods
-    without being coupled to a specific implementation.
+    without being coupled to a specific implementation. Subclasses must
+    override the methods that raise NotImplementedError.
     """
     
-    @abstractmethod
     def insert_money(self, amount: float) -> bool:
         """Insert money into the machine."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def get_balance(self) -> float:
         """Get the current balance."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def deduct(self, amount: float) -> Tuple[bool, float]:
         """Deduct an amount and return success status and remaining balance."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def refund(self) -> float:
         """Refund all money and return the amount."""
-        pass
+        raise NotImplementedError
+    
+    def get_balance_cents(self) -> int:
+        """Get the current balance in whole cents."""
+        return round(self.get_balance() * 100)
+    
+    def deduct_cents(self, amount_cents: int) -> Tuple[bool, int]:
+        """Deduct an amount given in cents and return success status and change in cents."""
+        success, change = self.deduct(amount_cents / 100)
+        return success, round(change * 100)
 
 
 class CashPaymentService(PaymentService):
@@ -40,10 +46,12 @@ class CashPaymentService(PaymentService):
     Cash-based payment service implementation.
     
     Handles cash transactions with proper validation and change calculation.
+    The balance is held in integer cents so repeated insertions and change
+    calculation are exact.
     """
     
     def __init__(self):
-        self._balance: float = 0.0
+        self._balance_cents: int = 0
     
     def insert_money(self, amount: float) -> bool:
         """
@@ -56,16 +64,23 @@ class CashPaymentService(PaymentService):
             True if successful
             
         Raises:
-            ValueError: If amount is not positive
+            ValueError: If amount is not finite or not at least one cent
         """
-        if amount <= 0:
+        if not math.isfinite(amount):
+            raise ValueError("Amount must be a finite number")
+        cents = round(amount * 100)
+        if cents <= 0:
             raise ValueError("Amount must be positive")
-        self._balance += amount
+        self._balance_cents += cents
         return True
     
     def get_balance(self) -> float:
         """Get the current cash balance."""
-        return self._balance
+        return self._balance_cents / 100
+    
+    def get_balance_cents(self) -> int:
+        """Get the current cash balance in cents."""
+        return self._balance_cents
     
     def deduct(self, amount: float) -> Tuple[bool, float]:
         """
@@ -77,15 +92,28 @@ class CashPaymentService(PaymentService):
         Returns:
             Tuple of (success, change_amount)
         """
-        if amount > self._balance:
-            return False, 0.0
+        success, change_cents = self.deduct_cents(round(amount * 100))
+        return success, change_cents / 100
+    
+    def deduct_cents(self, amount_cents: int) -> Tuple[bool, int]:
+        """
+        Deduct an amount given in cents from balance.
+        
+        Args:
+            amount_cents: Amount to deduct in cents
+            
+        Returns:
+            Tuple of (success, change_in_cents)
+        """
+        if amount_cents > self._balance_cents:
+            return False, 0
         
-        change = self._balance - amount
-        self._balance = 0.0
+        change = self._balance_cents - amount_cents
+        self._balance_cents = 0
         return True, change
     
     def refund(self) -> float:
         """Refund all inserted money."""
-        refund_amount = self._balance
-        self._balance = 0.0
+        refund_amount = self._balance_cents / 100
+        self._balance_cents = 0
         return refund_amount
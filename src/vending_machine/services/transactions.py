@@ -3,7 +3,8 @@ Transaction management service.
 Tracks all purchases and provides statistics.
 """
 from datetime import datetime
-from typing import List, Dict, Optional
+from itertools import count
+from typing import List, Dict, Iterator, Optional
 from enum import Enum
 
 
@@ -14,14 +15,32 @@ class TransactionStatus(Enum):
     CANCELLED = "CANCELLED"
 
 
+# Small-int status codes used for internal comparisons
+_STATUS_CODE = {
+    TransactionStatus.SUCCESS: 0,
+    TransactionStatus.FAILED: 1,
+    TransactionStatus.CANCELLED: 2,
+}
+_SUCCESS_CODE = _STATUS_CODE[TransactionStatus.SUCCESS]
+
+# Monotonic source of transaction ids shared by all transactions
+_id_counter = count(1)
+
+
 class Transaction:
     """
     Represents a single transaction.
     
-    Immutable record of a purchase attempt with all relevant details.
+    Record of a purchase attempt with all relevant details. Fields are
+    plain attributes set once at construction and should be treated
+    as read-only.
     """
     
-    _counter = 0
+    __slots__ = (
+        'id', 'timestamp', 'item_code', 'item_name',
+        'item_price', 'amount_paid', 'change_given', 'status',
+        '_status_code', '_status_value', '_dict_cache'
+    )
     
     def __init__(
         self,
@@ -32,60 +51,37 @@ class Transaction:
         change_given: float,
         status: TransactionStatus
     ):
-        Transaction._counter += 1
-        self._id = f"TXN-{Transaction._counter:04d}"
-        self._timestamp = datetime.now()
-        self._item_code = item_code
-        self._item_name = item_name
-        self._item_price = item_price
-        self._amount_paid = amount_paid
-        self._change_given = change_given
-        self._status = status
-    
-    @property
-    def id(self) -> str:
-        return self._id
-    
-    @property
-    def timestamp(self) -> datetime:
-        return self._timestamp
-    
-    @property
-    def item_code(self) -> str:
-        return self._item_code
-    
-    @property
-    def item_name(self) -> str:
-        return self._item_name
-    
-    @property
-    def item_price(self) -> float:
-        return self._item_price
-    
-    @property
-    def amount_paid(self) -> float:
-        return self._amount_paid
-    
-    @property
-    def change_given(self) -> float:
-        return self._change_given
-    
-    @property
-    def status(self) -> TransactionStatus:
-        return self._status
+        self.id = "TXN-%04d" % next(_id_counter)
+        self.timestamp = datetime.now()
+        self.item_code = item_code
+        self.item_name = item_name
+        self.item_price = item_price
+        self.amount_paid = amount_paid
+        self.change_given = change_given
+        self.status = status
+        self._status_code = _STATUS_CODE[status]
+        self._status_value = status.value
+        self._dict_cache: Optional[Dict] = None
     
     def to_dict(self) -> Dict:
-        """Convert transaction to dictionary representation."""
-        return {
-            'id': self._id,
-            'timestamp': self._timestamp.isoformat(),
-            'item_code': self._item_code,
-            'item_name': self._item_name,
-            'item_price': self._item_price,
-            'amount_paid': self._amount_paid,
-            'change_given': self._change_given,
-            'status': self._status.value
-        }
+        """
+        Convert transaction to dictionary representation.
+        
+        The dictionary is built on first use and the same object is
+        returned afterwards, so callers must not modify it.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'id': self.id,
+                'timestamp': self.timestamp.isoformat(),
+                'item_code': self.item_code,
+                'item_name': self.item_name,
+                'item_price': self.item_price,
+                'amount_paid': self.amount_paid,
+                'change_given': self.change_given,
+                'status': self._status_value
+            }
+        return self._dict_cache
 
 
 class TransactionService:
@@ -97,10 +93,26 @@ class TransactionService:
     
     def __init__(self):
         self._transactions: List[Transaction] = []
+        # Running totals so statistics don't rescan the history
+        self._success_count = 0
+        self._fail_count = 0
+        self._total_revenue_cents = 0
+        self._version = 0  # Bumped whenever the history changes
+    
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever a transaction is recorded."""
+        return self._version
     
     def record(self, transaction: Transaction) -> None:
         """Record a new transaction."""
         self._transactions.append(transaction)
+        self._version += 1
+        if transaction._status_code == _SUCCESS_CODE:
+            self._success_count += 1
+            self._total_revenue_cents += round(transaction.item_price * 100)
+        else:
+            self._fail_count += 1
     
     def create_success(
         self,
@@ -134,13 +146,34 @@ class TransactionService:
         self.record(txn)
         return txn
     
+    def __len__(self) -> int:
+        """Return the number of recorded transactions."""
+        return len(self._transactions)
+    
     def get_all(self) -> List[Dict]:
         """Get all transactions as dictionaries."""
         return [t.to_dict() for t in self._transactions]
     
+    def get_page(self, offset: int, limit: int) -> List[Dict]:
+        """
+        Get a slice of the transaction history as dictionaries.
+        
+        Args:
+            offset: Index of the first transaction to include
+            limit: Maximum number of transactions to return
+            
+        Returns:
+            Up to ``limit`` transactions, oldest first
+        """
+        return [t.to_dict() for t in self._transactions[offset:offset + limit]]
+    
+    def iter_successful(self) -> Iterator[Transaction]:
+        """Iterate over successful transactions without building a list."""
+        return (t for t in self._transactions if t._status_code == _SUCCESS_CODE)
+    
     def get_successful(self) -> List[Transaction]:
         """Get all successful transactions."""
-        return [t for t in self._transactions if t.status == TransactionStatus.SUCCESS]
+        return list(self.iter_successful())
     
     def get_statistics(self) -> Dict:
         """
@@ -149,14 +182,14 @@ class TransactionService:
         Returns:
             Dictionary with total, successful, failed counts and revenue
         """
-        successful = self.get_successful()
+        total = len(self._transactions)
         return {
-            'total_transactions': len(self._transactions),
-            'successful': len(successful),
-            'failed': len(self._transactions) - len(successful),
-            'total_revenue': sum(t.item_price for t in successful),
+            'total_transactions': total,
+            'successful': self._success_count,
+            'failed': self._fail_count,
+            'total_revenue': self._total_revenue_cents / 100,
             'success_rate': (
-                len(successful) / len(self._transactions) * 100
-                if self._transactions else 0
+                self._success_count / total * 100
+                if total else 0
             )
         }
@@ -2,11 +2,17 @@
 Admin menu handler for the vending machine.
 Provides administrative functions for managing the machine.
 """
+import hashlib
+import hmac
+import sys
 from typing import Optional
 from .display import Display
 from ..core import VendingMachine
 from ..models import Soda, Juice, Water
 
+# Number of transactions shown per page of the history view
+_TXN_PAGE = 50
+
 
 class AdminHandler:
     """
@@ -16,8 +22,10 @@ class AdminHandler:
     transaction viewing, and machine maintenance.
     """
     
-    # Simple admin password (in production, use proper authentication)
-    ADMIN_PASSWORD = "admin123"
+    # SHA-256 digest of the admin password (in production, use a salted KDF)
+    ADMIN_PASSWORD_HASH = bytes.fromhex(
+        "240be518fabd2724ddb6f04eeb1da5967448d7e831c08c8fa822809f74c720a9"
+    )
     
     def __init__(self, machine: VendingMachine):
         """
@@ -28,6 +36,12 @@ class AdminHandler:
         """
         self._machine = machine
         self._authenticated = False
+        # Report data reused while the underlying store is unchanged
+        self._stats_cache: Optional[dict] = None
+        self._stats_version = -1
+        self._inv_summary: Optional[tuple] = None
+        self._inv_summary_version = -1
+        self._inv_printed_version = -1  # Inventory version on screen, if any
     
     def authenticate(self) -> bool:
         """
@@ -36,8 +50,9 @@ class AdminHandler:
         Returns:
             True if authentication successful
         """
-        password = input("Enter admin password: ").strip()
-        if password == self.ADMIN_PASSWORD:
+        password = input("Enter admin password: ").strip().encode()
+        digest = hashlib.sha256(password).digest()
+        if hmac.compare_digest(digest, self.ADMIN_PASSWORD_HASH):
             self._authenticated = True
             Display.print_success("Authentication successful!")
             return True
@@ -52,10 +67,14 @@ class AdminHandler:
                 return
         
         Display.print_header("ADMIN PANEL")
+        self._inv_printed_version = -1  # Nothing from an earlier session is on screen
         
         while True:
             self._display_admin_options()
             choice = input("\nEnter choice (1-7): ").strip()
+            if choice not in ('1', '2'):
+                # Any other screen pushes the inventory table out of view
+                self._inv_printed_version = -1
             
             if choice == '1':
                 self._view_inventory()
@@ -86,34 +105,49 @@ class AdminHandler:
         print("6. Cash Out Machine")
         print("7. Exit Admin Panel")
     
-    def _view_inventory(self) -> None:
-        """Display full inventory details."""
-        Display.print_header("INVENTORY MANAGEMENT")
-        items = self._machine.get_menu()
+    def _view_inventory(self, skip_if_unchanged: bool = False) -> None:
+        """
+        Display full inventory details.
         
-        if not items:
-            Display.print_warning("Inventory is empty!")
+        Args:
+            skip_if_unchanged: Print a one-line hint instead of the table
+                when the inventory has not changed since it was last shown
+        """
+        version = self._machine.inventory.version
+        if skip_if_unchanged and version == self._inv_printed_version:
+            Display.print_info("Inventory unchanged since it was last shown.")
             return
         
-        print(f"\n{'Code':<6} | {'Name':<18} | {'Price':<8} | {'Qty':<5} | {'Category':<10} | {'Description'}")
-        print("-" * 85)
-        
-        for code, details in items.items():
-            print(
+        with Display.buffered():
+            Display.print_header("INVENTORY MANAGEMENT")
+            items = self._machine.get_menu()
+            self._inv_printed_version = version
+            
+            if not items:
+                Display.print_warning("Inventory is empty!")
+                return
+            
+            print(f"\n{'Code':<6} | {'Name':<18} | {'Price':<8} | {'Qty':<5} | {'Category':<10} | {'Description'}")
+            print("-" * 85)
+            
+            rows = [
                 f"{code:<6} | "
                 f"{details['name']:<18} | "
                 f"${details['price']:<7.2f} | "
                 f"{details['quantity']:<5} | "
                 f"{details['category']:<10} | "
                 f"{details['description']}"
-            )
-        
-        print("-" * 85)
-        print(f"Total unique products: {len(items)}")
+                for code, details in items.items()
+            ]
+            sys.stdout.write("\n".join(rows))
+            sys.stdout.write("\n")
+            
+            print("-" * 85)
+            print(f"Total unique products: {len(items)}")
     
     def _restock_item(self) -> None:
         """Restock an existing item."""
-        self._view_inventory()
+        self._view_inventory(skip_if_unchanged=True)
         
         code = input("\nEnter item code to restock: ").strip().upper()
         
@@ -127,9 +161,8 @@ class AdminHandler:
                 Display.print_error("Quantity must be positive!")
                 return
             
-            success = self._machine.inventory.restock(code, quantity)
+            success, new_qty = self._machine.inventory.restock_and_get(code, quantity)
             if success:
-                new_qty = self._machine.inventory.get_quantity(code)
                 Display.print_success(f"Restocked {code}. New quantity: {new_qty}")
             else:
                 Display.print_error("Failed to restock item!")
@@ -137,47 +170,78 @@ class AdminHandler:
             Display.print_error("Please enter a valid number!")
     
     def _view_transactions(self) -> None:
-        """Display all transactions."""
-        Display.print_header("TRANSACTION HISTORY")
-        
-        transactions = self._machine.transactions.get_all()
-        
-        if not transactions:
-            Display.print_warning("No transactions recorded yet.")
-            return
-        
-        print(f"\n{'ID':<12} | {'Time':<20} | {'Item':<15} | {'Price':<8} | {'Paid':<8} | {'Change':<8} | {'Status'}")
-        print("-" * 95)
+        """Display the transaction history, one page at a time."""
+        with Display.buffered():
+            Display.print_header("TRANSACTION HISTORY")
+            
+            service = self._machine.transactions
+            total = len(service)
+            
+            if not total:
+                Display.print_warning("No transactions recorded yet.")
+                return
+            
+            print(f"\n{'ID':<12} | {'Time':<20} | {'Item':<15} | {'Price':<8} | {'Paid':<8} | {'Change':<8} | {'Status'}")
+            print("-" * 95)
         
-        for txn in transactions:
-            timestamp = txn.get('timestamp', 'N/A')[:19]
-            print(
+        for start in range(0, total, _TXN_PAGE):
+            rows = [
                 f"{txn.get('id', 'N/A'):<12} | "
-                f"{timestamp:<20} | "
+                f"{txn.get('timestamp', 'N/A')[:19]:<20} | "
                 f"{txn.get('item_name', 'N/A'):<15} | "
                 f"${txn.get('item_price', 0):<7.2f} | "
                 f"${txn.get('amount_paid', 0):<7.2f} | "
                 f"${txn.get('change_given', 0):<7.2f} | "
                 f"{txn.get('status', 'N/A')}"
-            )
+                for txn in service.get_page(start, _TXN_PAGE)
+            ]
+            sys.stdout.write("\n".join(rows))
+            sys.stdout.write("\n")
+            
+            remaining = total - start - _TXN_PAGE
+            if remaining > 0:
+                more = input(f"Show more? ({remaining} remaining) (y/n): ").strip().lower()
+                if more != 'y':
+                    break
         
         print("-" * 95)
-        print(f"Total transactions: {len(transactions)}")
+        print(f"Total transactions: {total}")
     
     def _view_statistics(self) -> None:
         """Display detailed statistics."""
-        stats = self._machine.get_statistics()
-        Display.display_statistics(stats)
-        
-        # Extra admin stats
-        print("\n--- Inventory Summary ---")
-        items = self._machine.get_menu()
-        total_stock = sum(details['quantity'] for details in items.values())
-        out_of_stock = sum(1 for details in items.values() if details['quantity'] == 0)
-        
-        print(f"Total items in stock: {total_stock}")
-        print(f"Products out of stock: {out_of_stock}")
-        print(f"Unique products: {len(items)}")
+        with Display.buffered():
+            version = self._machine.transactions.version
+            if version != self._stats_version:
+                self._stats_cache = self._machine.get_statistics()
+                self._stats_version = version
+            Display.display_statistics(self._stats_cache)
+            
+            # Extra admin stats
+            print("\n--- Inventory Summary ---")
+            total_stock, out_of_stock, unique = self._inventory_summary()
+            
+            print(f"Total items in stock: {total_stock}")
+            print(f"Products out of stock: {out_of_stock}")
+            print(f"Unique products: {unique}")
+    
+    def _inventory_summary(self) -> tuple:
+        """
+        Get (total stock, products out of stock, unique products).
+        
+        Recomputed only when the inventory version changes.
+        """
+        version = self._machine.inventory.version
+        if version != self._inv_summary_version:
+            items = self._machine.get_menu()
+            total_stock = 0
+            out_of_stock = 0
+            for details in items.values():
+                quantity = details['quantity']
+                total_stock += quantity
+                out_of_stock += quantity == 0
+            self._inv_summary = (total_stock, out_of_stock, len(items))
+            self._inv_summary_version = version
+        return self._inv_summary
     
     def _add_new_item(self) -> None:
         """Add a new item to the inventory."""
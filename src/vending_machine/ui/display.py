@@ -2,8 +2,32 @@
 Display utilities for the CLI interface.
 Provides formatted output for a professional user experience.
 """
-from typing import Dict, List, Any
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Any
+import io
 import os
+import sys
+
+# ANSI sequence: clear the screen and move the cursor home
+_CLEAR_SEQ = "\x1b[2J\x1b[H"
+
+
+def _enable_windows_vt() -> bool:
+    """Enable ANSI escape processing on the Windows console; True on success."""
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_ulong()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
+
+
+_ANSI_CLEAR = os.name != 'nt' or _enable_windows_vt()
 
 
 class Display:
@@ -13,6 +37,26 @@ class Display:
     Provides static methods for consistent, professional CLI presentation.
     """
     
+    @staticmethod
+    @contextmanager
+    def buffered() -> Iterator[None]:
+        """
+        Collect everything printed inside the block and write it to stdout
+        in one call when the block exits.
+        
+        Do not prompt for input inside the block; the prompt would be
+        held back with the rest of the output.
+        """
+        target = sys.stdout
+        buffer = io.StringIO()
+        sys.stdout = buffer
+        try:
+            yield
+        finally:
+            sys.stdout = target
+            target.write(buffer.getvalue())
+            target.flush()
+    
     @staticmethod
     def print_header(title: str, width: int = 60) -> None:
         """Print a formatted header."""
@@ -55,22 +99,24 @@ class Display:
             items: Dictionary of items from inventory
             balance: Current user balance
         """
-        Display.print_header("VENDING MACHINE MENU")
-        print(f"\nYour Balance: ${balance:.2f}\n")
-        
-        headers = ["Code", "Name", "Price", "Stock", "Status"]
-        print(f"{'Code':<6} | {'Name':<18} | {'Price':<8} | {'Stock':<6} | {'Status'}")
-        print("-" * 60)
-        
-        for code, details in items.items():
-            status = "Available" if details['quantity'] > 0 else "OUT OF STOCK"
-            print(
+        with Display.buffered():
+            Display.print_header("VENDING MACHINE MENU")
+            print(f"\nYour Balance: ${balance:.2f}\n")
+            
+            print(f"{'Code':<6} | {'Name':<18} | {'Price':<8} | {'Stock':<6} | {'Status'}")
+            print("-" * 60)
+            
+            rows = [
                 f"{code:<6} | "
                 f"{details['name']:<18} | "
                 f"${details['price']:<7.2f} | "
                 f"{details['quantity']:<6} | "
-                f"{status}"
-            )
+                f"{'Available' if details['quantity'] > 0 else 'OUT OF STOCK'}"
+                for code, details in items.items()
+            ]
+            if rows:
+                sys.stdout.write("\n".join(rows))
+                sys.stdout.write("\n")
     
     @staticmethod
     def display_receipt(transaction: Dict, drink_desc: str = "") -> None:
@@ -129,7 +175,11 @@ class Display:
     @staticmethod
     def clear_screen() -> None:
         """Clear the console screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if _ANSI_CLEAR and sys.stdout.isatty():
+            sys.stdout.write(_CLEAR_SEQ)
+            sys.stdout.flush()
+        else:
+            os.system('cls' if os.name == 'nt' else 'clear')
     
     @staticmethod
     def print_divider(char: str = "-", length: int = 60) -> None:
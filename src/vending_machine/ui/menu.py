@@ -26,6 +26,12 @@ class MenuHandler:
         self._machine = machine
         self._running = True
         self._admin = AdminHandler(machine)
+        # Menu snapshot reused until a purchase or admin session changes stock
+        self._menu_cache: Optional[dict] = None
+        self._menu_dirty = True
+        # Statistics reused while the transaction history is unchanged
+        self._stats_cache: Optional[dict] = None
+        self._stats_version = -1
     
     def run(self) -> None:
         """Run the main menu loop."""
@@ -54,8 +60,10 @@ class MenuHandler:
     
     def _show_menu(self) -> None:
         """Display the product menu."""
-        items = self._machine.get_menu()
-        Display.display_menu(items, self._machine.balance)
+        if self._menu_dirty or self._menu_cache is None:
+            self._menu_cache = self._machine.get_menu()
+            self._menu_dirty = False
+        Display.display_menu(self._menu_cache, self._machine.balance)
     
     def _insert_money(self) -> None:
         """Handle money insertion."""
@@ -80,16 +88,20 @@ class MenuHandler:
         if success:
             Display.print_success(message)
             if transaction:
-                drink = self._machine.inventory.get_item(code)
-                desc = drink.get_description() if drink else ""
+                details = self._menu_cache.get(code)
+                desc = details['description'] if details else ""
                 Display.display_receipt(transaction, desc)
         else:
             Display.print_error(message)
+        self._menu_dirty = True
     
     def _show_statistics(self) -> None:
         """Display transaction statistics."""
-        stats = self._machine.get_statistics()
-        Display.display_statistics(stats)
+        version = self._machine.transactions.version
+        if version != self._stats_version:
+            self._stats_cache = self._machine.get_statistics()
+            self._stats_version = version
+        Display.display_statistics(self._stats_cache)
     
     def _refund_and_exit(self) -> None:
         """Refund money and exit."""
@@ -102,6 +114,7 @@ class MenuHandler:
     def _admin_mode(self) -> None:
         """Enter admin mode."""
         self._admin.run()
+        self._menu_dirty = True
     
     def _quit(self) -> None:
         """Quit without refund."""
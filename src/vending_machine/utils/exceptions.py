@@ -1,7 +1,12 @@
 """
 Custom exceptions for the vending machine.
 Provides domain-specific error handling.
+
+Each exception keeps its raw fields (also passed on as ``args``, so repr
+and pickling work) and only formats a message when converted to a string,
+so exceptions that are caught and discarded never pay for the formatting.
 """
+import math
 
 
 class VendingMachineError(Exception):
@@ -13,10 +18,14 @@ class InsufficientFundsError(VendingMachineError):
     """Raised when the user doesn't have enough money."""
     
     def __init__(self, required: float, available: float):
+        super().__init__(required, available)
         self.required = required
         self.available = available
-        super().__init__(
-            f"Insufficient funds. Required: ${required:.2f}, Available: ${available:.2f}"
+    
+    def __str__(self) -> str:
+        return (
+            f"Insufficient funds. Required: ${self.required:.2f}, "
+            f"Available: ${self.available:.2f}"
         )
 
 
@@ -24,21 +33,32 @@ class OutOfStockError(VendingMachineError):
     """Raised when a product is out of stock."""
     
     def __init__(self, product_name: str):
+        super().__init__(product_name)
         self.product_name = product_name
-        super().__init__(f"{product_name} is out of stock")
+    
+    def __str__(self) -> str:
+        return f"{self.product_name} is out of stock"
 
 
 class InvalidProductError(VendingMachineError):
     """Raised when an invalid product code is used."""
     
     def __init__(self, code: str):
+        super().__init__(code)
         self.code = code
-        super().__init__(f"Invalid product code: {code}")
+    
+    def __str__(self) -> str:
+        return f"Invalid product code: {self.code}"
 
 
 class InvalidAmountError(VendingMachineError):
     """Raised when an invalid amount is inserted."""
     
     def __init__(self, amount: float):
+        super().__init__(amount)
         self.amount = amount
-        super().__init__(f"Invalid amount: ${amount:.2f}. Amount must be positive.")
+    
+    def __str__(self) -> str:
+        if not math.isfinite(self.amount):
+            return f"Invalid amount: {self.amount}. Amount must be a finite number."
+        return f"Invalid amount: ${self.amount:.2f}. Amount must be positive."
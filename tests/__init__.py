@@ -1 +1,9 @@
 # Tests package
+import sys
+import pathlib
+
+# Every test module imports this package before vending_machine, so src is on
+# the import path under run_tests.py, python -m unittest and pytest alike.
+_SRC = str(pathlib.Path(__file__).resolve().parent.parent / "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
@@ -0,0 +1,26 @@
+"""
+Shared drink builders for the test suite.
+Keeps the standard product codes, names and prices in one place.
+"""
+from vending_machine.models import Soda, Juice, Water
+
+
+# (code, name, price) of the standard test products
+COLA_SPEC = ("A1", "Cola", 1.50)
+OJ_SPEC = ("B1", "OJ", 2.00)
+WATER_SPEC = ("C1", "Water", 1.00)
+
+
+def make_cola() -> Soda:
+    """Build the standard test cola."""
+    return Soda(*COLA_SPEC)
+
+
+def make_oj() -> Juice:
+    """Build the standard test orange juice."""
+    return Juice(*OJ_SPEC)
+
+
+def make_water() -> Water:
+    """Build the standard test water."""
+    return Water(*WATER_SPEC)
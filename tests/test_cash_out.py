@@ -1,15 +1,10 @@
-#!/usr/bin/env python3
 """
 Unit tests for cash-out functionality.
 Tests the VendingMachine's cash reserve tracking and cash-out operations.
 """
 import unittest
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+import tests  # noqa: F401  (puts src on the import path)
 from vending_machine.models import Inventory, Soda, Juice
 from vending_machine.core import VendingMachine
 
@@ -17,11 +12,15 @@ from vending_machine.core import VendingMachine
 class TestCashOut(unittest.TestCase):
     """Test cash-out and cash reserve functionality."""
     
+    # Drinks are never modified by these tests, so they are built once
+    COKE = Soda("A1", "Coke", 1.50)
+    ORANGE_JUICE = Juice("B1", "Orange Juice", 2.00, "Orange")
+    
     def setUp(self):
         """Set up test fixtures."""
         self.inventory = Inventory()
-        self.inventory.add_item(Soda("A1", "Coke", 1.50), 5)
-        self.inventory.add_item(Juice("B1", "Orange Juice", 2.00, "Orange"), 3)
+        self.inventory.add_item(self.COKE, 5)
+        self.inventory.add_item(self.ORANGE_JUICE, 3)
         self.machine = VendingMachine(self.inventory)
     
     def test_initial_cash_reserve_is_zero(self):
@@ -31,7 +30,7 @@ class TestCashOut(unittest.TestCase):
     def test_successful_purchase_adds_to_cash_reserve(self):
         """Test that successful purchases add to the cash reserve."""
         self.machine.insert_money(2.00)
-        success, message, _ = self.machine.select_item("A1")
+        success = self.machine.select_item("A1").success
         
         self.assertTrue(success)
         self.assertEqual(self.machine.cash_reserve, 1.50)
@@ -39,7 +38,7 @@ class TestCashOut(unittest.TestCase):
     def test_failed_purchase_does_not_add_to_cash_reserve(self):
         """Test that failed purchases don't affect cash reserve."""
         # Try to buy without money
-        success, message, _ = self.machine.select_item("A1")
+        success = self.machine.select_item("A1").success
         
         self.assertFalse(success)
         self.assertEqual(self.machine.cash_reserve, 0.0)
@@ -112,19 +111,14 @@ class TestCashOut(unittest.TestCase):
     def test_out_of_stock_does_not_add_to_cash_reserve(self):
         """Test that out-of-stock purchases don't add to cash reserve."""
         # Empty the stock
-        for _ in range(5):
-            self.machine.insert_money(2.00)
-            self.machine.select_item("A1")
+        self.assertTrue(self.machine._bulk_purchase("A1", 5))
+        self.assertEqual(self.machine.cash_reserve, 7.50)
         
         initial_reserve = self.machine.cash_reserve
         
         # Try to buy when out of stock
         self.machine.insert_money(2.00)
-        success, _, _ = self.machine.select_item("A1")
+        success = self.machine.select_item("A1").success
         
         self.assertFalse(success)
         self.assertEqual(self.machine.cash_reserve, initial_reserve)
-
-
-if __name__ == '__main__':
-    unittest.main()
@@ -3,12 +3,10 @@ Unit tests for the Drink models.
 Tests the inheritance hierarchy and polymorphic behavior.
 """
 import unittest
-import sys
-import os
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+import tests  # noqa: F401  (puts src on the import path)
 from vending_machine.models import Drink, Soda, Juice, Water
+from tests.fixtures import make_cola, make_oj, make_water
 
 
 class TestDrinkBase(unittest.TestCase):
@@ -23,13 +21,20 @@ class TestDrinkBase(unittest.TestCase):
         """Creating a drink with negative price should raise ValueError."""
         with self.assertRaises(ValueError):
             Soda("X1", "Bad Drink", -1.00)
+    
+    def test_non_finite_price_raises_error(self):
+        """Creating a drink with an infinite or NaN price should raise ValueError."""
+        for price in (float('inf'), float('nan')):
+            with self.subTest(price=price):
+                with self.assertRaises(ValueError):
+                    Soda("X1", "Bad Drink", price)
 
 
 class TestSoda(unittest.TestCase):
     """Test the Soda class."""
     
     def setUp(self):
-        self.regular_soda = Soda("A1", "Cola", 1.50)
+        self.regular_soda = make_cola()
         self.diet_soda = Soda("A2", "Diet Cola", 1.50, is_diet=True)
     
     def test_soda_properties(self):
@@ -121,9 +126,9 @@ class TestPolymorphism(unittest.TestCase):
     def test_all_drinks_have_category(self):
         """All drink types should implement get_category."""
         drinks = [
-            Soda("A1", "Cola", 1.50),
-            Juice("B1", "OJ", 2.00),
-            Water("C1", "Water", 1.00)
+            make_cola(),
+            make_oj(),
+            make_water()
         ]
         categories = [d.get_category() for d in drinks]
         self.assertEqual(categories, ["Soda", "Juice", "Water"])
@@ -131,15 +136,25 @@ class TestPolymorphism(unittest.TestCase):
     def test_all_drinks_have_description(self):
         """All drink types should implement get_description."""
         drinks = [
-            Soda("A1", "Cola", 1.50),
-            Juice("B1", "OJ", 2.00),
-            Water("C1", "Water", 1.00)
+            make_cola(),
+            make_oj(),
+            make_water()
         ]
         for drink in drinks:
             desc = drink.get_description()
             self.assertIsInstance(desc, str)
             self.assertTrue(len(desc) > 0)
-
-
-if __name__ == '__main__':
-    unittest.main(verbosity=2)
+    
+    def test_type_flags_are_read_only(self):
+        """Type-specific flags should not be reassignable after construction."""
+        cases = (
+            (Soda("A2", "Diet Cola", 1.50, is_diet=True), 'is_diet', False),
+            (Juice("B2", "Apple Juice", 2.00, fruit_type="Apple"), 'fruit_type', "Grape"),
+            (Water("C2", "Sparkling Water", 1.25, is_sparkling=True), 'is_sparkling', False),
+        )
+        for drink, flag, value in cases:
+            with self.subTest(flag=flag):
+                description = drink.get_description()
+                with self.assertRaises(AttributeError):
+                    setattr(drink, flag, value)
+                self.assertEqual(drink.get_description(), description)
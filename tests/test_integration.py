@@ -2,24 +2,32 @@
 Integration tests for the Vending Machine system.
 Tests complete workflows end-to-end.
 """
+import copy
 import unittest
-import sys
-import os
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import tests  # noqa: F401  (puts src on the import path)
+from vending_machine.models import Inventory, Soda
+from vending_machine.core import VendingMachine, OUT_OF_STOCK_SUFFIX
+from tests.fixtures import make_cola, make_oj, make_water
 
-from vending_machine.models import Inventory, Soda, Juice, Water
-from vending_machine.core import VendingMachine
+
+COLA = make_cola()
+OJ = make_oj()
+WATER = make_water()
 
 
 class TestCompletePurchaseWorkflow(unittest.TestCase):
     """Test complete purchase scenarios."""
     
+    @classmethod
+    def setUpClass(cls):
+        cls._template_inventory = Inventory()
+        cls._template_inventory.add_item(COLA, 3)
+        cls._template_inventory.add_item(OJ, 2)
+        cls._template_inventory.add_item(WATER, 5)
+    
     def setUp(self):
-        self.inventory = Inventory()
-        self.inventory.add_item(Soda("A1", "Cola", 1.50), 3)
-        self.inventory.add_item(Juice("B1", "OJ", 2.00), 2)
-        self.inventory.add_item(Water("C1", "Water", 1.00), 5)
+        self.inventory = copy.copy(self._template_inventory)
         self.machine = VendingMachine(self.inventory)
     
     def test_single_purchase_workflow(self):
@@ -41,11 +49,11 @@ class TestCompletePurchaseWorkflow(unittest.TestCase):
         """Test multiple sequential purchases."""
         # First purchase
         self.machine.insert_money(2.00)
-        success1, _, _ = self.machine.select_item("A1")
+        success1 = self.machine.select_item("A1").success
         
         # Second purchase
         self.machine.insert_money(1.00)
-        success2, _, _ = self.machine.select_item("C1")
+        success2 = self.machine.select_item("C1").success
         
         # Verify
         self.assertTrue(success1)
@@ -59,7 +67,7 @@ class TestCompletePurchaseWorkflow(unittest.TestCase):
         self.machine.insert_money(0.50)
         self.machine.insert_money(0.50)
         
-        success, _, _ = self.machine.select_item("A1")
+        success = self.machine.select_item("A1").success
         
         self.assertTrue(success)
 
@@ -67,20 +75,24 @@ class TestCompletePurchaseWorkflow(unittest.TestCase):
 class TestDepletionWorkflow(unittest.TestCase):
     """Test stock depletion scenarios."""
     
+    @classmethod
+    def setUpClass(cls):
+        cls._template_inventory = Inventory()
+        cls._template_inventory.add_item(Soda("A1", "Cola", 1.00), 2)  # Only 2 in stock
+    
     def setUp(self):
-        self.inventory = Inventory()
-        self.inventory.add_item(Soda("A1", "Cola", 1.00), 2)  # Only 2 in stock
+        self.inventory = copy.copy(self._template_inventory)
         self.machine = VendingMachine(self.inventory)
     
     def test_deplete_stock(self):
         """Test buying until out of stock."""
         # Buy first
         self.machine.insert_money(1.00)
-        success1, _, _ = self.machine.select_item("A1")
+        success1 = self.machine.select_item("A1").success
         
         # Buy second
         self.machine.insert_money(1.00)
-        success2, _, _ = self.machine.select_item("A1")
+        success2 = self.machine.select_item("A1").success
         
         # Third should fail
         self.machine.insert_money(1.00)
@@ -89,16 +101,20 @@ class TestDepletionWorkflow(unittest.TestCase):
         self.assertTrue(success1)
         self.assertTrue(success2)
         self.assertFalse(success3)
-        self.assertIn("out of stock", message3.lower())
+        self.assertEqual(message3, "Cola" + OUT_OF_STOCK_SUFFIX)
 
 
 class TestStatisticsWorkflow(unittest.TestCase):
     """Test statistics accumulation."""
     
+    @classmethod
+    def setUpClass(cls):
+        cls._template_inventory = Inventory()
+        cls._template_inventory.add_item(COLA, 5)
+        cls._template_inventory.add_item(WATER, 5)
+    
     def setUp(self):
-        self.inventory = Inventory()
-        self.inventory.add_item(Soda("A1", "Cola", 1.50), 5)
-        self.inventory.add_item(Water("C1", "Water", 1.00), 5)
+        self.inventory = copy.copy(self._template_inventory)
         self.machine = VendingMachine(self.inventory)
     
     def test_statistics_after_transactions(self):
@@ -125,9 +141,13 @@ class TestStatisticsWorkflow(unittest.TestCase):
 class TestRefundWorkflow(unittest.TestCase):
     """Test refund scenarios."""
     
+    @classmethod
+    def setUpClass(cls):
+        cls._template_inventory = Inventory()
+        cls._template_inventory.add_item(COLA, 5)
+    
     def setUp(self):
-        self.inventory = Inventory()
-        self.inventory.add_item(Soda("A1", "Cola", 1.50), 5)
+        self.inventory = copy.copy(self._template_inventory)
         self.machine = VendingMachine(self.inventory)
     
     def test_refund_before_purchase(self):
@@ -146,7 +166,3 @@ class TestRefundWorkflow(unittest.TestCase):
         refund = self.machine.refund()
         
         self.assertEqual(refund, 1.00)
-
-
-if __name__ == '__main__':
-    unittest.main(verbosity=2)
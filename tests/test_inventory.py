@@ -2,13 +2,17 @@
 Unit tests for the Inventory class.
 Tests stock management and product lookup.
 """
+import copy
 import unittest
-import sys
-import os
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import tests  # noqa: F401  (puts src on the import path)
+from vending_machine.models import Inventory
+from tests.fixtures import make_cola, make_oj, make_water
 
-from vending_machine.models import Inventory, Soda, Juice, Water
+
+COLA = make_cola()
+OJ = make_oj()
+WATER = make_water()
 
 
 class TestInventoryBasics(unittest.TestCase):
@@ -16,8 +20,8 @@ class TestInventoryBasics(unittest.TestCase):
     
     def setUp(self):
         self.inventory = Inventory()
-        self.cola = Soda("A1", "Cola", 1.50)
-        self.water = Water("C1", "Water", 1.00)
+        self.cola = make_cola()
+        self.water = make_water()
     
     def test_empty_inventory(self):
         """New inventory should be empty."""
@@ -39,6 +43,26 @@ class TestInventoryBasics(unittest.TestCase):
         retrieved = self.inventory.get_item("A1")
         self.assertEqual(retrieved.name, "Cola")
     
+    def test_copy_has_independent_stock(self):
+        """A copied inventory should not share stock levels with the original."""
+        self.inventory.add_item(self.cola, 1)
+        clone = copy.copy(self.inventory)
+        clone.decrement_stock("A1")
+        self.assertEqual(self.inventory.get_quantity("A1"), 1)
+        self.assertEqual(len(self.inventory.get_available_items()), 1)
+        self.assertEqual(clone.get_quantity("A1"), 0)
+    
+    def test_copy_keeps_subclass(self):
+        """Copying an Inventory subclass should return that subclass."""
+        class TaggedInventory(Inventory):
+            pass
+        
+        original = TaggedInventory()
+        original.tag = "lobby"
+        clone = copy.copy(original)
+        self.assertIs(type(clone), TaggedInventory)
+        self.assertEqual(clone.tag, "lobby")
+    
     def test_get_nonexistent_item(self):
         """Getting non-existent item should return None."""
         result = self.inventory.get_item("Z9")
@@ -48,10 +72,13 @@ class TestInventoryBasics(unittest.TestCase):
 class TestInventoryStock(unittest.TestCase):
     """Test stock management operations."""
     
+    @classmethod
+    def setUpClass(cls):
+        cls._template_inventory = Inventory()
+        cls._template_inventory.add_item(COLA, 3)
+    
     def setUp(self):
-        self.inventory = Inventory()
-        self.cola = Soda("A1", "Cola", 1.50)
-        self.inventory.add_item(self.cola, 3)
+        self.inventory = copy.copy(self._template_inventory)
     
     def test_has_stock(self):
         """has_stock should return True for stocked items."""
@@ -59,9 +86,7 @@ class TestInventoryStock(unittest.TestCase):
     
     def test_has_stock_empty(self):
         """has_stock should return False for empty stock."""
-        # Deplete stock
-        for _ in range(3):
-            self.inventory.decrement_stock("A1")
+        self.inventory.decrement_stock("A1", 3)
         self.assertFalse(self.inventory.has_stock("A1"))
     
     def test_has_stock_nonexistent(self):
@@ -86,10 +111,42 @@ class TestInventoryStock(unittest.TestCase):
         result = self.inventory.decrement_stock("A1")
         self.assertTrue(result)
     
+    def test_decrement_stock_count(self):
+        """decrement_stock should only remove a positive count it can cover."""
+        cases = (
+            (0, False, 3),
+            (1, True, 2),
+            (3, True, 0),
+            (4, False, 3),
+        )
+        for count, expected, remaining in cases:
+            with self.subTest(count=count):
+                inventory = copy.copy(self._template_inventory)
+                self.assertEqual(inventory.decrement_stock("A1", count), expected)
+                self.assertEqual(inventory.get_quantity("A1"), remaining)
+                self.assertEqual(inventory.has_stock("A1"), remaining > 0)
+    
+    def test_decrement_stock_count_nonexistent(self):
+        """decrement_stock should not create entries for unknown codes."""
+        for count in (0, 1):
+            with self.subTest(count=count):
+                self.assertFalse(self.inventory.decrement_stock("Z9", count))
+                # A stray quantity entry would let restock accept the unknown code
+                self.assertFalse(self.inventory.restock("Z9", 5))
+                self.assertFalse(self.inventory.has_stock("Z9"))
+    
+    def test_version_changes_on_stock_updates(self):
+        """version should move on stock changes but not on failed ones."""
+        start = self.inventory.version
+        self.inventory.decrement_stock("A1")
+        after_decrement = self.inventory.version
+        self.inventory.restock("Z9", 5)
+        self.assertNotEqual(after_decrement, start)
+        self.assertEqual(self.inventory.version, after_decrement)
+    
     def test_decrement_empty_stock_returns_false(self):
         """decrement_stock should return False when empty."""
-        for _ in range(3):
-            self.inventory.decrement_stock("A1")
+        self.inventory.decrement_stock("A1", 3)
         result = self.inventory.decrement_stock("A1")
         self.assertFalse(result)
 
@@ -97,10 +154,13 @@ class TestInventoryStock(unittest.TestCase):
 class TestInventoryRestock(unittest.TestCase):
     """Test restocking operations."""
     
+    @classmethod
+    def setUpClass(cls):
+        cls._template_inventory = Inventory()
+        cls._template_inventory.add_item(COLA, 2)
+    
     def setUp(self):
-        self.inventory = Inventory()
-        self.cola = Soda("A1", "Cola", 1.50)
-        self.inventory.add_item(self.cola, 2)
+        self.inventory = copy.copy(self._template_inventory)
     
     def test_restock(self):
         """restock should add to existing quantity."""
@@ -117,6 +177,11 @@ class TestInventoryRestock(unittest.TestCase):
         result = self.inventory.restock("Z9", 5)
         self.assertFalse(result)
     
+    def test_restock_and_get(self):
+        """restock_and_get should report the new quantity."""
+        self.assertEqual(self.inventory.restock_and_get("A1", 5), (True, 7))
+        self.assertEqual(self.inventory.restock_and_get("Z9", 5), (False, 0))
+    
     def test_restock_negative_raises_error(self):
         """restock with negative quantity should raise error."""
         with self.assertRaises(ValueError):
@@ -126,15 +191,15 @@ class TestInventoryRestock(unittest.TestCase):
 class TestInventoryQueries(unittest.TestCase):
     """Test inventory query methods."""
     
+    @classmethod
+    def setUpClass(cls):
+        cls._template_inventory = Inventory()
+        cls._template_inventory.add_item(COLA, 3)
+        cls._template_inventory.add_item(WATER, 0)  # Out of stock
+        cls._template_inventory.add_item(OJ, 2)
+    
     def setUp(self):
-        self.inventory = Inventory()
-        self.cola = Soda("A1", "Cola", 1.50)
-        self.water = Water("C1", "Water", 1.00)
-        self.oj = Juice("B1", "OJ", 2.00)
-        
-        self.inventory.add_item(self.cola, 3)
-        self.inventory.add_item(self.water, 0)  # Out of stock
-        self.inventory.add_item(self.oj, 2)
+        self.inventory = copy.copy(self._template_inventory)
     
     def test_get_all_items(self):
         """get_all_items should return all items with details."""
@@ -151,7 +216,19 @@ class TestInventoryQueries(unittest.TestCase):
         self.assertIn("Cola", names)
         self.assertIn("OJ", names)
         self.assertNotIn("Water", names)
-
-
-if __name__ == '__main__':
-    unittest.main(verbosity=2)
+    
+    def test_get_available_items_tracks_stock_changes(self):
+        """get_available_items should follow depletion and restocking."""
+        self.inventory.decrement_stock("B1")
+        self.inventory.decrement_stock("B1")
+        self.inventory.restock("C1", 4)
+        names = [d.name for d in self.inventory.get_available_items()]
+        self.assertNotIn("OJ", names)
+        self.assertIn("Water", names)
+    
+    def test_get_available_items_order(self):
+        """get_available_items should list drinks in the order they came into stock."""
+        self.inventory.restock("C1", 4)
+        codes = [d.code for d in self.inventory.get_available_items()]
+        self.assertEqual(codes, ["A1", "B1", "C1"])
+        self.assertEqual(list(self.inventory.get_all_items()), ["A1", "C1", "B1"])
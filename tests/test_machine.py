@@ -2,24 +2,34 @@
 Unit tests for the VendingMachine core class.
 Tests the main controller orchestration.
 """
+import copy
+import pickle
 import unittest
-import sys
-import os
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from vending_machine.models import Inventory, Soda, Juice, Water
-from vending_machine.core import VendingMachine
+import tests  # noqa: F401  (puts src on the import path)
+from vending_machine.models import Inventory
+from vending_machine.core import (
+    VendingMachine,
+    INVALID_PRODUCT_PREFIX,
+    OUT_OF_STOCK_SUFFIX,
+    INSUFFICIENT_FUNDS_PREFIX
+)
+from vending_machine.services import CashPaymentService, TransactionService
 from vending_machine.utils import InvalidAmountError
+from tests.fixtures import make_cola, make_water
 
 
 class TestVendingMachineBasics(unittest.TestCase):
     """Test basic vending machine operations."""
     
+    @classmethod
+    def setUpClass(cls):
+        cls._template_inventory = Inventory()
+        cls._template_inventory.add_item(make_cola(), 5)
+        cls._template_inventory.add_item(make_water(), 3)
+    
     def setUp(self):
-        self.inventory = Inventory()
-        self.inventory.add_item(Soda("A1", "Cola", 1.50), 5)
-        self.inventory.add_item(Water("C1", "Water", 1.00), 3)
+        self.inventory = copy.copy(self._template_inventory)
         self.machine = VendingMachine(self.inventory)
     
     def test_initial_balance_is_zero(self):
@@ -36,24 +46,48 @@ class TestVendingMachineBasics(unittest.TestCase):
         result = self.machine.insert_money(2.50)
         self.assertEqual(result, 2.50)
     
-    def test_insert_negative_raises_error(self):
-        """Inserting negative amount should raise InvalidAmountError."""
-        with self.assertRaises(InvalidAmountError):
+    def test_insert_non_positive_raises_error(self):
+        """Inserting a negative or zero amount should raise InvalidAmountError."""
+        for amount in (-1.00, 0):
+            with self.subTest(amount=amount):
+                with self.assertRaises(InvalidAmountError):
+                    self.machine.insert_money(amount)
+    
+    def test_insert_unusable_amount_raises_error(self):
+        """Non-finite or sub-cent insertions should raise InvalidAmountError."""
+        for amount in (float('inf'), float('nan'), 0.004):
+            with self.subTest(amount=amount):
+                with self.assertRaises(InvalidAmountError):
+                    self.machine.insert_money(amount)
+                self.assertEqual(self.machine.balance, 0.0)
+        with self.assertRaises(InvalidAmountError) as ctx:
+            self.machine.insert_money(float('inf'))
+        self.assertEqual(str(ctx.exception), "Invalid amount: inf. Amount must be a finite number.")
+    
+    def test_invalid_amount_error_message(self):
+        """InvalidAmountError should describe the rejected amount."""
+        with self.assertRaises(InvalidAmountError) as ctx:
             self.machine.insert_money(-1.00)
+        self.assertEqual(str(ctx.exception), "Invalid amount: $-1.00. Amount must be positive.")
     
-    def test_insert_zero_raises_error(self):
-        """Inserting zero should raise InvalidAmountError."""
-        with self.assertRaises(InvalidAmountError):
-            self.machine.insert_money(0)
+    def test_invalid_amount_error_round_trips(self):
+        """InvalidAmountError should keep its amount in args and survive pickling."""
+        error = pickle.loads(pickle.dumps(InvalidAmountError(-1.00)))
+        self.assertEqual(error.args, (-1.00,))
+        self.assertEqual(str(error), "Invalid amount: $-1.00. Amount must be positive.")
 
 
 class TestVendingMachinePurchase(unittest.TestCase):
     """Test purchase functionality."""
     
+    @classmethod
+    def setUpClass(cls):
+        cls._template_inventory = Inventory()
+        cls._template_inventory.add_item(make_cola(), 2)
+        cls._template_inventory.add_item(make_water(), 1)
+    
     def setUp(self):
-        self.inventory = Inventory()
-        self.inventory.add_item(Soda("A1", "Cola", 1.50), 2)
-        self.inventory.add_item(Water("C1", "Water", 1.00), 1)
+        self.inventory = copy.copy(self._template_inventory)
         self.machine = VendingMachine(self.inventory)
     
     def test_successful_purchase(self):
@@ -68,7 +102,7 @@ class TestVendingMachinePurchase(unittest.TestCase):
     def test_purchase_returns_change(self):
         """Successful purchase should show correct change."""
         self.machine.insert_money(2.00)
-        success, message, txn = self.machine.select_item("A1")
+        message = self.machine.select_item("A1").message
         
         self.assertIn("$0.50", message)
     
@@ -89,19 +123,32 @@ class TestVendingMachinePurchase(unittest.TestCase):
     def test_purchase_returns_transaction(self):
         """Successful purchase should return transaction dict."""
         self.machine.insert_money(2.00)
-        success, message, txn = self.machine.select_item("A1")
+        txn = self.machine.select_item("A1").transaction
         
         self.assertIsNotNone(txn)
         self.assertIn("id", txn)
         self.assertEqual(txn["item_name"], "Cola")
+    
+    def test_purchase_result_fields(self):
+        """select_item should expose its outcome as named fields."""
+        self.machine.insert_money(2.00)
+        result = self.machine.select_item("A1")
+        
+        self.assertTrue(result.success)
+        self.assertIn("Dispensing", result.message)
+        self.assertEqual(result.transaction["item_code"], "A1")
 
 
 class TestVendingMachineFailures(unittest.TestCase):
     """Test failure scenarios."""
     
+    @classmethod
+    def setUpClass(cls):
+        cls._template_inventory = Inventory()
+        cls._template_inventory.add_item(make_cola(), 1)
+    
     def setUp(self):
-        self.inventory = Inventory()
-        self.inventory.add_item(Soda("A1", "Cola", 1.50), 1)
+        self.inventory = copy.copy(self._template_inventory)
         self.machine = VendingMachine(self.inventory)
     
     def test_insufficient_funds(self):
@@ -110,7 +157,7 @@ class TestVendingMachineFailures(unittest.TestCase):
         success, message, txn = self.machine.select_item("A1")
         
         self.assertFalse(success)
-        self.assertIn("Insufficient", message)
+        self.assertTrue(message.startswith(INSUFFICIENT_FUNDS_PREFIX))
     
     def test_insufficient_funds_keeps_balance(self):
         """Failed purchase should keep balance intact."""
@@ -130,7 +177,7 @@ class TestVendingMachineFailures(unittest.TestCase):
         success, message, txn = self.machine.select_item("A1")
         
         self.assertFalse(success)
-        self.assertIn("out of stock", message.lower())
+        self.assertEqual(message, "Cola" + OUT_OF_STOCK_SUFFIX)
     
     def test_invalid_product_code(self):
         """Should fail with invalid product code."""
@@ -138,15 +185,66 @@ class TestVendingMachineFailures(unittest.TestCase):
         success, message, txn = self.machine.select_item("Z9")
         
         self.assertFalse(success)
-        self.assertIn("Invalid", message)
+        self.assertEqual(message, INVALID_PRODUCT_PREFIX + "Z9")
+
+
+class TestVendingMachineCustomPayment(unittest.TestCase):
+    """Test purchases through a payment service other than the stock one."""
+    
+    def setUp(self):
+        class CountingPaymentService(CashPaymentService):
+            def __init__(self):
+                super().__init__()
+                self.deductions = 0
+            
+            def deduct_cents(self, amount_cents):
+                self.deductions += 1
+                return super().deduct_cents(amount_cents)
+        
+        self.inventory = Inventory()
+        self.inventory.add_item(make_cola(), 1)
+        self.payment = CountingPaymentService()
+        self.machine = VendingMachine(self.inventory, payment_service=self.payment)
+    
+    def test_purchase_uses_payment_service(self):
+        """Purchases should go through a custom payment service."""
+        self.machine.insert_money(2.00)
+        success, message, txn = self.machine.select_item("A1")
+        
+        self.assertTrue(success)
+        self.assertIn("$0.50", message)
+        self.assertEqual(self.payment.deductions, 1)
+        self.assertEqual(self.machine.cash_reserve, 1.50)
+        self.assertEqual(self.inventory.get_quantity("A1"), 0)
+
+
+class TestVendingMachineCustomTransactions(unittest.TestCase):
+    """Test purchases recorded into a caller-supplied transaction service."""
+    
+    def test_empty_transaction_service_is_used(self):
+        """An empty service should still be used rather than replaced."""
+        service = TransactionService()
+        inventory = Inventory()
+        inventory.add_item(make_cola(), 1)
+        machine = VendingMachine(inventory, transaction_service=service)
+        
+        machine.insert_money(2.00)
+        machine.select_item("A1")
+        
+        self.assertIs(machine.transactions, service)
+        self.assertEqual(len(service), 1)
 
 
 class TestVendingMachineRefund(unittest.TestCase):
     """Test refund functionality."""
     
+    @classmethod
+    def setUpClass(cls):
+        cls._template_inventory = Inventory()
+        cls._template_inventory.add_item(make_cola(), 5)
+    
     def setUp(self):
-        self.inventory = Inventory()
-        self.inventory.add_item(Soda("A1", "Cola", 1.50), 5)
+        self.inventory = copy.copy(self._template_inventory)
         self.machine = VendingMachine(self.inventory)
     
     def test_refund_returns_balance(self):
@@ -172,26 +270,28 @@ class TestVendingMachineRefund(unittest.TestCase):
 class TestVendingMachineStatistics(unittest.TestCase):
     """Test statistics functionality."""
     
-    def setUp(self):
-        self.inventory = Inventory()
-        self.inventory.add_item(Soda("A1", "Cola", 1.50), 5)
-        self.inventory.add_item(Water("C1", "Water", 1.00), 5)
-        self.machine = VendingMachine(self.inventory)
-    
-    def test_get_statistics(self):
-        """get_statistics should return stats dict."""
-        # Make some transactions
-        self.machine.insert_money(2.00)
-        self.machine.select_item("A1")
+    @classmethod
+    def setUpClass(cls):
+        # The tests only read the statistics, so the purchases run once
+        inventory = Inventory()
+        inventory.add_item(make_cola(), 5)
+        inventory.add_item(make_water(), 5)
+        machine = VendingMachine(inventory)
         
-        self.machine.insert_money(1.00)
-        self.machine.select_item("C1")
+        machine.insert_money(2.00)
+        machine.select_item("A1")
         
-        stats = self.machine.get_statistics()
+        machine.insert_money(1.00)
+        machine.select_item("C1")
         
-        self.assertEqual(stats['successful'], 2)
-        self.assertEqual(stats['total_revenue'], 2.50)
-
-
-if __name__ == '__main__':
-    unittest.main(verbosity=2)
+        cls.stats = machine.get_statistics()
+    
+    def test_get_statistics(self):
+        """get_statistics should return stats dict."""
+        self.assertEqual(self.stats['successful'], 2)
+        self.assertEqual(self.stats['total_revenue'], 2.50)
+    
+    def test_statistics_count_every_purchase(self):
+        """get_statistics should count each completed purchase."""
+        self.assertEqual(self.stats['total_transactions'], 2)
+        self.assertEqual(self.stats['failed'], 0)
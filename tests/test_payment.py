@@ -3,17 +3,21 @@ Unit tests for Payment services.
 Tests payment processing and refund functionality.
 """
 import unittest
-import sys
-import os
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+import tests  # noqa: F401  (puts src on the import path)
 from vending_machine.services import CashPaymentService
 
 
 class TestCashPaymentService(unittest.TestCase):
     """Test the CashPaymentService class."""
     
+    # (insert, deduct, expected success, expected change, balance after)
+    CASES = (
+        (2.00, 1.50, True, 0.50, 0.0),
+        (1.50, 1.50, True, 0.0, 0.0),
+        (1.00, 1.50, False, 0.0, 1.00),
+    )
+    
     def setUp(self):
         self.payment = CashPaymentService()
     
@@ -32,42 +36,40 @@ class TestCashPaymentService(unittest.TestCase):
         self.payment.insert_money(0.50)
         self.assertEqual(self.payment.get_balance(), 1.50)
     
-    def test_insert_negative_raises_error(self):
-        """Inserting negative amount should raise error."""
-        with self.assertRaises(ValueError):
-            self.payment.insert_money(-1.00)
-    
-    def test_insert_zero_raises_error(self):
-        """Inserting zero should raise error."""
-        with self.assertRaises(ValueError):
-            self.payment.insert_money(0)
-    
-    def test_deduct_success(self):
-        """deduct should return True and change on success."""
-        self.payment.insert_money(2.00)
-        success, change = self.payment.deduct(1.50)
-        self.assertTrue(success)
-        self.assertEqual(change, 0.50)
-    
-    def test_deduct_exact_amount(self):
-        """deduct with exact amount should return 0 change."""
-        self.payment.insert_money(1.50)
-        success, change = self.payment.deduct(1.50)
+    def test_insert_money_fractional_amounts_are_exact(self):
+        """Fractional insertions should add up without rounding drift."""
+        for _ in range(3):
+            self.payment.insert_money(0.10)
+        self.assertEqual(self.payment.get_balance(), 0.30)
+        success, change = self.payment.deduct(0.30)
         self.assertTrue(success)
         self.assertEqual(change, 0.0)
     
-    def test_deduct_insufficient_funds(self):
-        """deduct should return False when insufficient funds."""
-        self.payment.insert_money(1.00)
-        success, change = self.payment.deduct(1.50)
-        self.assertFalse(success)
-        self.assertEqual(change, 0.0)
+    def test_insert_non_positive_raises_error(self):
+        """Inserting a negative or zero amount should raise error."""
+        for amount in (-1.00, 0):
+            with self.subTest(amount=amount):
+                with self.assertRaises(ValueError):
+                    self.payment.insert_money(amount)
     
-    def test_deduct_resets_balance(self):
-        """deduct should reset balance to zero."""
-        self.payment.insert_money(2.00)
-        self.payment.deduct(1.50)
-        self.assertEqual(self.payment.get_balance(), 0.0)
+    def test_insert_unusable_amount_raises_error(self):
+        """Non-finite or sub-cent insertions should raise error and add nothing."""
+        for amount in (float('inf'), float('nan'), 0.004):
+            with self.subTest(amount=amount):
+                with self.assertRaises(ValueError):
+                    self.payment.insert_money(amount)
+                self.assertEqual(self.payment.get_balance(), 0.0)
+    
+    def test_deduct_table(self):
+        """deduct should report success, change and the remaining balance."""
+        for inserted, price, expected_success, expected_change, balance in self.CASES:
+            with self.subTest(insert=inserted, deduct=price):
+                payment = CashPaymentService()
+                payment.insert_money(inserted)
+                success, change = payment.deduct(price)
+                self.assertEqual(success, expected_success)
+                self.assertEqual(change, expected_change)
+                self.assertEqual(payment.get_balance(), balance)
     
     def test_refund(self):
         """refund should return full balance."""
@@ -85,7 +87,3 @@ class TestCashPaymentService(unittest.TestCase):
         """refund with empty balance should return 0."""
         refund = self.payment.refund()
         self.assertEqual(refund, 0.0)
-
-
-if __name__ == '__main__':
-    unittest.main(verbosity=2)
@@ -3,14 +3,17 @@ Unit tests for Transaction services.
 Tests transaction recording and statistics.
 """
 import unittest
-import sys
-import os
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+import tests  # noqa: F401  (puts src on the import path)
 from vending_machine.services import TransactionService, TransactionStatus
 
 
+# (code, name, price, paid, change) for create_success
+COLA_SALE = ("A1", "Cola", 1.50, 2.00, 0.50)
+PEPSI_SALE = ("A2", "Pepsi", 1.50, 2.00, 0.50)
+OJ_SALE = ("B1", "OJ", 2.00, 3.00, 1.00)
+
+
 class TestTransactionService(unittest.TestCase):
     """Test the TransactionService class."""
     
@@ -19,13 +22,11 @@ class TestTransactionService(unittest.TestCase):
     
     def test_initial_empty(self):
         """Service should start with no transactions."""
-        self.assertEqual(len(self.service.get_all()), 0)
+        self.assertEqual(len(self.service), 0)
     
     def test_create_success_transaction(self):
         """create_success should create and record a transaction."""
-        txn = self.service.create_success(
-            "A1", "Cola", 1.50, 2.00, 0.50
-        )
+        txn = self.service.create_success(*COLA_SALE)
         self.assertEqual(txn.status, TransactionStatus.SUCCESS)
         self.assertEqual(txn.item_name, "Cola")
         self.assertEqual(txn.item_price, 1.50)
@@ -40,25 +41,45 @@ class TestTransactionService(unittest.TestCase):
     
     def test_transaction_has_id(self):
         """Transactions should have unique IDs."""
-        txn1 = self.service.create_success("A1", "Cola", 1.50, 2.00, 0.50)
-        txn2 = self.service.create_success("A2", "Pepsi", 1.50, 2.00, 0.50)
+        txn1 = self.service.create_success(*COLA_SALE)
+        txn2 = self.service.create_success(*PEPSI_SALE)
         self.assertNotEqual(txn1.id, txn2.id)
     
     def test_transaction_has_timestamp(self):
         """Transactions should have timestamps."""
-        txn = self.service.create_success("A1", "Cola", 1.50, 2.00, 0.50)
+        txn = self.service.create_success(*COLA_SALE)
         self.assertIsNotNone(txn.timestamp)
     
     def test_get_all_returns_list(self):
         """get_all should return list of dictionaries."""
-        self.service.create_success("A1", "Cola", 1.50, 2.00, 0.50)
+        self.service.create_success(*COLA_SALE)
         result = self.service.get_all()
         self.assertIsInstance(result, list)
         self.assertIsInstance(result[0], dict)
     
+    def test_version_changes_on_record(self):
+        """version should change each time a transaction is recorded."""
+        start = self.service.version
+        self.service.create_failed("A1", "Cola", 1.50, 1.00, "")
+        self.assertNotEqual(self.service.version, start)
+    
+    def test_len_counts_recorded_transactions(self):
+        """len() should count every recorded transaction."""
+        self.service.create_success(*COLA_SALE)
+        self.service.create_failed("A1", "Cola", 1.50, 1.00, "")
+        self.assertEqual(len(self.service), 2)
+    
+    def test_get_page(self):
+        """get_page should return the requested slice as dictionaries."""
+        for code in ("A1", "A2", "A3"):
+            self.service.create_success(code, "Cola", 1.50, 2.00, 0.50)
+        page = self.service.get_page(1, 5)
+        self.assertEqual([t['item_code'] for t in page], ["A2", "A3"])
+        self.assertEqual(self.service.get_page(3, 5), [])
+    
     def test_get_successful(self):
         """get_successful should only return successful transactions."""
-        self.service.create_success("A1", "Cola", 1.50, 2.00, 0.50)
+        self.service.create_success(*COLA_SALE)
         self.service.create_failed("A2", "Pepsi", 1.50, 1.00, "")
         self.service.create_success("A3", "Sprite", 1.25, 2.00, 0.75)
         
@@ -69,38 +90,56 @@ class TestTransactionService(unittest.TestCase):
 class TestTransactionStatistics(unittest.TestCase):
     """Test transaction statistics."""
     
-    def setUp(self):
-        self.service = TransactionService()
+    @classmethod
+    def setUpClass(cls):
+        cls.service = TransactionService()
         # Create mix of transactions
-        self.service.create_success("A1", "Cola", 1.50, 2.00, 0.50)
-        self.service.create_success("A2", "Pepsi", 1.50, 2.00, 0.50)
-        self.service.create_failed("A3", "Sprite", 1.25, 1.00, "")
-        self.service.create_success("B1", "OJ", 2.00, 3.00, 1.00)
+        cls.service.create_success(*COLA_SALE)
+        cls.service.create_success(*PEPSI_SALE)
+        cls.service.create_failed("A3", "Sprite", 1.25, 1.00, "")
+        cls.service.create_success(*OJ_SALE)
+        # The tests only read the service, so one snapshot serves the class
+        cls.stats = cls.service.get_statistics()
+    
+    @classmethod
+    def tearDownClass(cls):
+        # Runs after every test, so it catches any test that mutated the shared service
+        count = len(cls.service.get_all())
+        if count != 4:
+            raise AssertionError(
+                f"shared service was modified: {count} transactions, expected 4"
+            )
     
     def test_total_transactions(self):
         """Statistics should show correct total."""
-        stats = self.service.get_statistics()
-        self.assertEqual(stats['total_transactions'], 4)
+        self.assertEqual(self.stats['total_transactions'], 4)
     
     def test_successful_count(self):
         """Statistics should show correct successful count."""
-        stats = self.service.get_statistics()
-        self.assertEqual(stats['successful'], 3)
+        self.assertEqual(self.stats['successful'], 3)
     
     def test_failed_count(self):
         """Statistics should show correct failed count."""
-        stats = self.service.get_statistics()
-        self.assertEqual(stats['failed'], 1)
+        self.assertEqual(self.stats['failed'], 1)
     
     def test_total_revenue(self):
         """Statistics should calculate correct revenue."""
-        stats = self.service.get_statistics()
-        self.assertEqual(stats['total_revenue'], 5.00)  # 1.50 + 1.50 + 2.00
+        self.assertEqual(self.stats['total_revenue'], 5.00)  # 1.50 + 1.50 + 2.00
     
     def test_success_rate(self):
         """Statistics should calculate correct success rate."""
-        stats = self.service.get_statistics()
-        self.assertEqual(stats['success_rate'], 75.0)
+        self.assertEqual(self.stats['success_rate'], 75.0)
+
+
+class TestRevenueAccumulation(unittest.TestCase):
+    """Test revenue totals over many transactions."""
+    
+    def test_revenue_has_no_rounding_drift(self):
+        """Summing many fractional prices should stay exact."""
+        service = TransactionService()
+        for _ in range(1000):
+            service.create_success("A1", "Gum", 0.10, 0.10, 0.0)
+        self.assertEqual(service.get_statistics()['total_revenue'], 100.00)
 
 
 class TestEmptyStatistics(unittest.TestCase):
@@ -116,7 +155,3 @@ class TestEmptyStatistics(unittest.TestCase):
         self.assertEqual(stats['failed'], 0)
         self.assertEqual(stats['total_revenue'], 0)
         self.assertEqual(stats['success_rate'], 0)
-
-
-if __name__ == '__main__':
-    unittest.main(verbosity=2)